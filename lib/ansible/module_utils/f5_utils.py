@@ -363,11 +363,11 @@ class AnsibleF5Parameters(object):
     def __getattr__(self, item):
         # Ensures that properties that weren't defined, and therefore stashed
         # in the `_values` dict, will be retrievable.
-        return self._values[item]
+        return self._values.get(item)
 
     @property
     def partition(self):
-        if self._values['partition'] is None:
+        if self._values.get('partition') is None:
             return 'Common'
         return self._values['partition'].strip('/')
 
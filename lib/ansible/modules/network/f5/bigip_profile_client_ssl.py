@@ -121,14 +121,11 @@ ciphers:
   sample: "!SSLv3:!SSLv2:ECDHE+AES-GCM+SHA256:ECDHE-RSA-AES128-CBC-SHA"
 '''
 
-import os
-
 from ansible.module_utils.f5_utils import AnsibleF5Client
 from ansible.module_utils.f5_utils import AnsibleF5Parameters
 from ansible.module_utils.f5_utils import HAS_F5SDK
 from ansible.module_utils.f5_utils import F5ModuleError
-from ansible.module_utils.six import iteritems
-from collections import defaultdict
+from operator import itemgetter
 
 try:
     from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
@@ -146,51 +143,66 @@ class Parameters(AnsibleF5Parameters):
         'ciphers', 'certKeyChain', 'ocspStapling'
     ]
 
-    returnables = [
+    # Pairs of (API attribute, module attribute) walked by api_params(). The
+    # map() call avoids a comprehension, which cannot see class level names.
+    _api_attr_pairs = tuple(
+        zip(api_attributes, map(api_map.get, api_attributes, api_attributes))
+    )
+
+    returnables = (
         'ciphers', 'ocsp_stapling'
-    ]
+    )
 
-    updatables = [
+    updatables = (
         'ciphers', 'cert_key_chain', 'ocsp_stapling'
-    ]
+    )
 
     def __init__(self, params=None):
-        self._values = defaultdict(lambda: None)
+        self._values = {}
         self._values['__warnings'] = []
         if params:
             self.update(params=params)
 
+    @classmethod
+    def _property_setters(cls):
+        # Names of the properties that have a setter. These are worked out
+        # once per class instead of inspecting the class on every update.
+        if '_setters' not in cls.__dict__:
+            attrs = {}
+            for klass in reversed(cls.__mro__):
+                attrs.update(vars(klass))
+            cls._setters = frozenset(
+                k for k, v in attrs.items()
+                if isinstance(v, property) and v.fset is not None
+            )
+        return cls._setters
+
     def update(self, params=None):
         if params:
-            for k, v in iteritems(params):
-                if self.api_map is not None and k in self.api_map:
-                    map_key = self.api_map[k]
-                else:
-                    map_key = k
+            setters = self._property_setters()
+            api_map = self.api_map
+            for k, v in params.items():
+                map_key = api_map.get(k, k)
+
+                if map_key in ('cert_key_chain', 'partition'):
+                    # Discard the list built by the cert_key_chain property
+                    self._values.pop('__cert_key_chain', None)
 
                 # Handle weird API parameters like `dns.proxy.__iter__` by
                 # using a map provided by the module developer
-                class_attr = getattr(type(self), map_key, None)
-                if isinstance(class_attr, property):
-                    # There is a mapped value for the api_map key
-                    if class_attr.fset is None:
-                        # If the mapped value does not have
-                        # an associated setter
-                        self._values[map_key] = v
-                    else:
-                        # The mapped value has a setter
-                        setattr(self, map_key, v)
+                if map_key in setters:
+                    # The mapped value has a setter
+                    setattr(self, map_key, v)
                 else:
-                    # If the mapped value is not a @property
+                    # The mapped value is not a @property, or is a
+                    # @property without an associated setter
                     self._values[map_key] = v
 
     def api_params(self):
-        result = {}
-        for api_attribute in self.api_attributes:
-            if self.api_map is not None and api_attribute in self.api_map:
-                result[api_attribute] = getattr(self, self.api_map[api_attribute])
-            else:
-                result[api_attribute] = getattr(self, api_attribute)
+        result = dict(
+            (api_attribute, getattr(self, attribute))
+            for api_attribute, attribute in self._api_attr_pairs
+        )
         result = self._filter_params(result)
         return result
 
@@ -198,15 +210,9 @@ class Parameters(AnsibleF5Parameters):
 class ModuleParameters(Parameters):
     def _fqdn_name(self, value):
         if value is not None and not value.startswith('/'):
-            return '/{0}/{1}'.format(self.partition, value)
+            return '/' + self.partition + '/' + value
         return value
 
-    def _key_filename(self, name):
-        if name.endswith('.key'):
-            return name
-        else:
-            return name + '.key'
-
     def _cert_filename(self, name):
         if name.endswith('.crt'):
             return name
@@ -222,58 +228,70 @@ class ModuleParameters(Parameters):
 
     @property
     def parent(self):
-        if self._values['parent'] is None:
+        if self._values.get('parent') is None:
             return None
         result = self._fqdn_name(self._values['parent'])
         return result
 
     @property
     def cert_key_chain(self):
-        if self._values['cert_key_chain'] is None:
+        if '__cert_key_chain' in self._values:
+            return self._values['__cert_key_chain']
+        if self._values.get('cert_key_chain') is None:
             return None
+        prefix = '/' + self.partition + '/'
         result = []
         for item in self._values['cert_key_chain']:
-            if 'key' in item and 'cert' not in item:
-                raise F5ModuleError(
-                    "When providing a 'key', you must also provide a 'cert'"
-                )
-            if 'cert' in item and 'key' not in item:
+            has_key = 'key' in item
+            if has_key != ('cert' in item):
+                if has_key:
+                    raise F5ModuleError(
+                        "When providing a 'key', you must also provide a 'cert'"
+                    )
                 raise F5ModuleError(
                     "When providing a 'cert', you must also provide a 'key'"
                 )
-            key = self._key_filename(item['key'])
-            cert = self._cert_filename(item['cert'])
+            key = item['key']
+            if not key.endswith('.key'):
+                key += '.key'
+            cert = item['cert']
+            if not cert.endswith('.crt'):
+                cert += '.crt'
             chain = self._get_chain_value(item)
-            name = os.path.basename(cert)
-            filename, ex = os.path.splitext(name)
+            # The profile entry is named after the cert file, minus '.crt'
+            name = cert.rsplit('/', 1)[-1][:-4]
             tmp = {
-                'name': filename,
-                'cert': self._fqdn_name(cert),
-                'key': self._fqdn_name(key),
+                'name': name,
+                'cert': cert if cert.startswith('/') else prefix + cert,
+                'key': key if key.startswith('/') else prefix + key,
                 'chain': chain
             }
             if 'passphrase' in item:
                 tmp['passphrase'] = item['passphrase']
             result.append(tmp)
-        result = sorted(result, key=lambda x: x['name'])
+        result = sorted(result, key=itemgetter('name'))
+        self._values['__cert_key_chain'] = result
         return result
 
 
 class ApiParameters(Parameters):
+    cert_key_chain_keys = frozenset([
+        'name', 'cert', 'key', 'chain', 'passphrase'
+    ])
+
     @property
     def cert_key_chain(self):
-        if self._values['cert_key_chain'] is None:
+        if '__cert_key_chain' in self._values:
+            return self._values['__cert_key_chain']
+        if self._values.get('cert_key_chain') is None:
             return None
-        result = []
-        for item in self._values['cert_key_chain']:
-            tmp = dict(
-                name=item['name'],
-            )
-            for x in ['cert', 'key', 'chain', 'passphrase']:
-                if x in item:
-                    tmp[x] = item[x]
-            result.append(tmp)
-        result = sorted(result, key=lambda x: x['name'])
+        keys = self.cert_key_chain_keys
+        result = [
+            {k: v for k, v in item.items() if k in keys}
+            for item in self._values['cert_key_chain']
+        ]
+        result = sorted(result, key=itemgetter('name'))
+        self._values['__cert_key_chain'] = result
         return result
 
 
@@ -281,8 +299,10 @@ class Changes(Parameters):
     def to_return(self):
         result = {}
         try:
-            for returnable in self.returnables:
-                result[returnable] = getattr(self, returnable)
+            result = dict(
+                (returnable, getattr(self, returnable))
+                for returnable in self.returnables
+            )
             result = self._filter_params(result)
         except Exception:
             pass
@@ -293,22 +313,19 @@ class UsableChanges(Changes):
     pass
 
 
-class ReportableChanges(Changes):
-    pass
-
-
 class Difference(object):
     def __init__(self, want, have=None):
         self.want = want
         self.have = have
 
     def compare(self, param):
-        try:
+        # Only parameters with a custom diff are properties on this class;
+        # checking the class avoids raising AttributeError for the rest.
+        if isinstance(getattr(type(self), param, None), property):
             result = getattr(self, param)
-            return result
-        except AttributeError:
+        else:
             result = self.__default(param)
-            return result
+        return result
 
     def __default(self, param):
         attr1 = getattr(self.want, param)
@@ -320,10 +337,9 @@ class Difference(object):
             return attr1
 
     def to_tuple(self, items):
-        result = []
-        for x in items:
-            tmp = [(str(k), str(v)) for k, v in iteritems(x)]
-            result += tmp
+        result = [
+            frozenset((str(k), str(v)) for k, v in x.items()) for x in items
+        ]
         return result
 
     def _diff_complex_items(self, want, have):
@@ -357,12 +373,15 @@ class ModuleManager(object):
         self.want = ModuleParameters(params=self.client.module.params)
         self.have = ApiParameters()
         self.changes = UsableChanges()
+        self._collection = None
+        self._resource = None
 
     def _set_changed_options(self):
         changed = {}
         for key in Parameters.returnables:
-            if getattr(self.want, key) is not None:
-                changed[key] = getattr(self.want, key)
+            value = getattr(self.want, key)
+            if value is not None:
+                changed[key] = value
         if changed:
             self.changes = UsableChanges(changed)
 
@@ -371,6 +390,9 @@ class ModuleManager(object):
         updatables = Parameters.updatables
         changed = dict()
         for k in updatables:
+            # Nothing to compare when the user did not ask for a value
+            if getattr(self.want, k) is None:
+                continue
             change = diff.compare(k)
             if change is None:
                 continue
@@ -397,8 +419,7 @@ class ModuleManager(object):
         except iControlUnexpectedHTTPError as e:
             raise F5ModuleError(str(e))
 
-        reportable = ReportableChanges(self.changes.to_return())
-        changes = reportable.to_return()
+        changes = self.changes.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
         self._announce_deprecations(result)
@@ -451,48 +472,60 @@ class ModuleManager(object):
         if self.client.check_mode:
             return True
         self.remove_from_device()
-        if self.exists():
-            raise F5ModuleError("Failed to delete the profile.")
         return True
 
+    def _get_collection(self):
+        if self._collection is None:
+            self._collection = self.client.api.tm.ltm.profile.client_ssls.client_ssl
+        return self._collection
+
+    def _get_resource(self):
+        if self._resource is None:
+            self._resource = self._get_collection().load(
+                name=self.want.name,
+                partition=self.want.partition
+            )
+        return self._resource
+
     def read_current_from_device(self):
-        resource = self.client.api.tm.ltm.profile.client_ssls.client_ssl.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self._get_resource()
         result = resource.attrs
         return ApiParameters(result)
 
     def exists(self):
-        result = self.client.api.tm.ltm.profile.client_ssls.client_ssl.exists(
-            name=self.want.name,
-            partition=self.want.partition
-        )
-        return result
+        try:
+            self._get_resource()
+        except iControlUnexpectedHTTPError as ex:
+            if ex.response.status_code == 404:
+                return False
+            raise
+        return True
 
     def update_on_device(self):
         params = self.changes.api_params()
-        result = self.client.api.tm.ltm.profile.client_ssls.client_ssl.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
-        result.modify(**params)
+        resource = self._get_resource()
+        resource.modify(**params)
 
     def create_on_device(self):
         params = self.want.api_params()
-        self.client.api.tm.ltm.profile.client_ssls.client_ssl.create(
+        self._get_collection().create(
             name=self.want.name,
             partition=self.want.partition,
             **params
         )
 
     def remove_from_device(self):
-        result = self.client.api.tm.ltm.profile.client_ssls.client_ssl.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
-        if result:
-            result.delete()
+        resource = self._get_resource()
+        try:
+            resource.delete()
+        except iControlUnexpectedHTTPError as ex:
+            # Someone else removed the profile in the meantime
+            if ex.response.status_code != 404:
+                raise F5ModuleError(
+                    "Failed to delete the profile: {0}".format(str(ex))
+                )
+        self._collection = None
+        self._resource = None
 
 
 class ArgumentSpec(object):
@@ -517,10 +550,12 @@ class ArgumentSpec(object):
 
 def cleanup_tokens(client):
     try:
-        resource = client.api.shared.authz.tokens_s.token.load(
-            name=client.api.icrs.token
-        )
-        resource.delete()
+        # Sessions that did not authenticate with a token have nothing
+        # to clean up, so skip the load and delete round-trips.
+        token = getattr(client.api.icrs, 'token', None)
+        if not token:
+            return
+        client.api.shared.authz.tokens_s.token.load(name=token).delete()
     except Exception:
         pass
 
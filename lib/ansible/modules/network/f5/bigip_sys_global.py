@@ -146,8 +146,6 @@ from ansible.module_utils.f5_utils import F5ModuleError
 from ansible.module_utils.parsing.convert_bool import BOOLEANS
 from ansible.module_utils.parsing.convert_bool import BOOLEANS_TRUE
 from ansible.module_utils.parsing.convert_bool import BOOLEANS_FALSE
-from ansible.module_utils.six import iteritems
-from collections import defaultdict
 
 try:
     from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
@@ -155,6 +153,14 @@ except ImportError:
     HAS_F5SDK = False
 
 
+# Values accepted as true and false by the boolean-like options
+_TRUE_SET = frozenset(list(BOOLEANS_TRUE) + ['True'])
+_FALSE_SET = frozenset(list(BOOLEANS_FALSE) + ['False'])
+
+# Choices accepted by the boolean-like options
+_ON_OFF_CHOICES = tuple(['enabled', 'disabled', 'True', 'False'] + list(BOOLEANS))
+
+
 class Parameters(AnsibleF5Parameters):
     api_map = {
         'guiSecurityBanner': 'security_banner',
@@ -172,25 +178,46 @@ class Parameters(AnsibleF5Parameters):
         'mgmtDhcp', 'netReboot', 'quietBoot', 'consoleInactivityTimeout'
     ]
 
-    returnables = [
+    # Pairs of (API attribute, module attribute) walked by api_params(). The
+    # map() call avoids a comprehension, which cannot see class level names.
+    _api_attr_pairs = tuple(
+        zip(api_attributes, map(api_map.get, api_attributes, api_attributes))
+    )
+
+    returnables = (
         'security_banner', 'banner_text', 'gui_setup', 'lcd_display',
         'mgmt_dhcp', 'net_reboot', 'quiet_boot', 'console_timeout'
-    ]
+    )
 
-    updatables = [
+    updatables = (
         'security_banner', 'banner_text', 'gui_setup', 'lcd_display',
         'mgmt_dhcp', 'net_reboot', 'quiet_boot', 'console_timeout'
-    ]
+    )
 
     def __init__(self, params=None):
-        self._values = defaultdict(lambda: None)
+        self._values = {}
         self._values['__warnings'] = []
         if params:
             self.update(params=params)
 
+    @classmethod
+    def _property_setters(cls):
+        # Names of the properties that have a setter. These are worked out
+        # once per class instead of inspecting the class on every update.
+        if '_setters' not in cls.__dict__:
+            attrs = {}
+            for klass in reversed(cls.__mro__):
+                attrs.update(vars(klass))
+            cls._setters = frozenset(
+                k for k, v in attrs.items()
+                if isinstance(v, property) and v.fset is not None
+            )
+        return cls._setters
+
     def update(self, params=None):
         if params:
-            for k, v in iteritems(params):
+            setters = self._property_setters()
+            for k, v in params.items():
                 if self.api_map is not None and k in self.api_map:
                     map_key = self.api_map[k]
                 else:
@@ -198,28 +225,20 @@ class Parameters(AnsibleF5Parameters):
 
                 # Handle weird API parameters like `dns.proxy.__iter__` by
                 # using a map provided by the module developer
-                class_attr = getattr(type(self), map_key, None)
-                if isinstance(class_attr, property):
-                    # There is a mapped value for the api_map key
-                    if class_attr.fset is None:
-                        # If the mapped value does not have
-                        # an associated setter
-                        self._values[map_key] = v
-                    else:
-                        # The mapped value has a setter
-                        setattr(self, map_key, v)
+                if map_key in setters:
+                    # The mapped value has a setter
+                    setattr(self, map_key, v)
                 else:
-                    # If the mapped value is not a @property
+                    # The mapped value is not a @property, or is a
+                    # @property without an associated setter
                     self._values[map_key] = v
 
     def api_params(self):
         result = {}
-        for api_attribute in self.api_attributes:
-            if self.api_map is not None and api_attribute in self.api_map:
-                result[api_attribute] = getattr(self, self.api_map[api_attribute])
-            else:
-                result[api_attribute] = getattr(self, api_attribute)
-        result = self._filter_params(result)
+        for api_attribute, attribute in self._api_attr_pairs:
+            value = getattr(self, attribute)
+            if value is not None:
+                result[api_attribute] = value
         return result
 
 
@@ -227,68 +246,45 @@ class ApiParameters(Parameters):
     pass
 
 
+# Builds the read-only property for one boolean-like module option
+def _boolean_like_property(parameter):
+    def getter(self):
+        return self._get_boolean_like_return_value(parameter)
+    return property(getter)
+
+
 class ModuleParameters(Parameters):
     def _get_boolean_like_return_value(self, parameter):
-        if self._values[parameter] is None:
+        value = self._values.get(parameter)
+        if value is None:
             return None
-        elif self._values[parameter] in ['enabled', 'disabled']:
+        elif value in ['enabled', 'disabled']:
             self._values['__warnings'].append(
                 dict(version='2.5', msg='enabled/disabled are deprecated. Use boolean values (true, yes, no, 1, 0) instead.')
             )
-        true = list(BOOLEANS_TRUE) + ['True']
-        false = list(BOOLEANS_FALSE) + ['False']
-        if self._values[parameter] in true:
+        if value in _TRUE_SET:
             return 'enabled'
-        if self._values[parameter] in false:
+        if value in _FALSE_SET:
             return 'disabled'
         else:
-            return str(self._values[parameter])
-
-    @property
-    def security_banner(self):
-        result = self._get_boolean_like_return_value('security_banner')
-        return result
+            return str(value)
 
-    @property
-    def gui_setup(self):
-        result = self._get_boolean_like_return_value('gui_setup')
-        return result
-
-    @property
-    def banner_text(self):
-        result = self._get_boolean_like_return_value('banner_text')
-        return result
-
-    @property
-    def lcd_display(self):
-        result = self._get_boolean_like_return_value('lcd_display')
-        return result
-
-    @property
-    def mgmt_dhcp(self):
-        result = self._get_boolean_like_return_value('mgmt_dhcp')
-        return result
-
-    @property
-    def net_reboot(self):
-        result = self._get_boolean_like_return_value('net_reboot')
-        return result
-
-    @property
-    def quiet_boot(self):
-        result = self._get_boolean_like_return_value('quiet_boot')
-        return result
+    security_banner = _boolean_like_property('security_banner')
+    gui_setup = _boolean_like_property('gui_setup')
+    banner_text = _boolean_like_property('banner_text')
+    lcd_display = _boolean_like_property('lcd_display')
+    mgmt_dhcp = _boolean_like_property('mgmt_dhcp')
+    net_reboot = _boolean_like_property('net_reboot')
+    quiet_boot = _boolean_like_property('quiet_boot')
 
 
 class Changes(Parameters):
     def to_return(self):
         result = {}
-        try:
-            for returnable in self.returnables:
-                result[returnable] = getattr(self, returnable)
-            result = self._filter_params(result)
-        except Exception:
-            pass
+        for returnable in self.returnables:
+            value = getattr(self, returnable, None)
+            if value is not None:
+                result[returnable] = value
         return result
 
 
@@ -296,29 +292,24 @@ class UsableChanges(Changes):
     pass
 
 
-class ReportableChanges(Changes):
-    pass
-
-
 class Difference(object):
     def __init__(self, want, have=None):
         self.want = want
         self.have = have
 
     def compare(self, param):
-        try:
+        # Only parameters with a custom diff are properties on this class;
+        # checking the class avoids raising AttributeError for the rest.
+        if isinstance(getattr(type(self), param, None), property):
             result = getattr(self, param)
-            return result
-        except AttributeError:
-            return self.__default(param)
+        else:
+            result = self.__default(param)
+        return result
 
     def __default(self, param):
         attr1 = getattr(self.want, param)
-        try:
-            attr2 = getattr(self.have, param)
-            if attr1 != attr2:
-                return attr1
-        except AttributeError:
+        attr2 = getattr(self.have, param, None)
+        if attr1 != attr2:
             return attr1
 
 
@@ -328,20 +319,16 @@ class ModuleManager(object):
         self.want = ModuleParameters(params=self.client.module.params)
         self.have = ApiParameters()
         self.changes = UsableChanges()
-
-    def _set_changed_options(self):
-        changed = {}
-        for key in Parameters.returnables:
-            if getattr(self.want, key) is not None:
-                changed[key] = getattr(self.want, key)
-        if changed:
-            self.changes = UsableChanges(changed)
+        self._resource = None
 
     def _update_changed_options(self):
         diff = Difference(self.want, self.have)
         updatables = Parameters.updatables
         changed = dict()
         for k in updatables:
+            # Nothing to compare when the user did not ask for a value
+            if getattr(self.want, k) is None:
+                continue
             change = diff.compare(k)
             if change is None:
                 continue
@@ -369,8 +356,7 @@ class ModuleManager(object):
         except iControlUnexpectedHTTPError as e:
             raise F5ModuleError(str(e))
 
-        reportable = ReportableChanges(self.changes.to_return())
-        changes = reportable.to_return()
+        changes = self.changes.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
         self._announce_deprecations(result)
@@ -387,12 +373,21 @@ class ModuleManager(object):
     def present(self):
         return self.update()
 
+    def _get_resource(self):
+        if self._resource is None:
+            self._resource = self.client.api.tm.sys.global_settings.load()
+        return self._resource
+
     def read_current_from_device(self):
-        resource = self.client.api.tm.sys.global_settings.load()
+        resource = self._get_resource()
         result = resource.attrs
         return ApiParameters(result)
 
     def update(self):
+        # Without any requested settings there is nothing to compare, so
+        # skip reading the current settings from the device.
+        if all(getattr(self.want, k) is None for k in Parameters.updatables):
+            return False
         self.have = self.read_current_from_device()
         if not self.should_update():
             return False
@@ -402,8 +397,8 @@ class ModuleManager(object):
         return True
 
     def update_on_device(self):
-        params = self.want.api_params()
-        resource = self.client.api.tm.sys.global_settings.load()
+        params = self.changes.api_params()
+        resource = self._get_resource()
         resource.modify(**params)
 
 
@@ -411,26 +406,25 @@ class ArgumentSpec(object):
     def __init__(self):
         self.supports_check_mode = True
         self.states = ['present']
-        self.on_off_choices = ['enabled', 'disabled', 'True', 'False'] + list(BOOLEANS)
         self.argument_spec = dict(
             security_banner=dict(
-                choices=self.on_off_choices
+                choices=_ON_OFF_CHOICES
             ),
             banner_text=dict(),
             gui_setup=dict(
-                choices=self.on_off_choices
+                choices=_ON_OFF_CHOICES
             ),
             lcd_display=dict(
-                choices=self.on_off_choices
+                choices=_ON_OFF_CHOICES
             ),
             mgmt_dhcp=dict(
-                choices=self.on_off_choices
+                choices=_ON_OFF_CHOICES
             ),
             net_reboot=dict(
-                choices=self.on_off_choices
+                choices=_ON_OFF_CHOICES
             ),
             quiet_boot=dict(
-                choices=self.on_off_choices
+                choices=_ON_OFF_CHOICES
             ),
             console_timeout=dict(required=False, type='int', default=None),
             state=dict(default='present', choices=['present'])
@@ -23,6 +23,7 @@ from ansible.module_utils.f5_utils import AnsibleF5Client
 try:
     from library.bigip_profile_client_ssl import ModuleParameters
     from library.bigip_profile_client_ssl import ApiParameters
+    from library.bigip_profile_client_ssl import Difference
     from library.bigip_profile_client_ssl import ModuleManager
     from library.bigip_profile_client_ssl import ArgumentSpec
     from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
@@ -31,6 +32,7 @@ except ImportError:
     try:
         from ansible.modules.network.f5.bigip_profile_client_ssl import ModuleParameters
         from ansible.modules.network.f5.bigip_profile_client_ssl import ApiParameters
+        from ansible.modules.network.f5.bigip_profile_client_ssl import Difference
         from ansible.modules.network.f5.bigip_profile_client_ssl import ModuleManager
         from ansible.modules.network.f5.bigip_profile_client_ssl import ArgumentSpec
         from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
@@ -86,6 +88,31 @@ class TestParameters(unittest.TestCase):
         assert p.name == 'foo'
         assert p.ciphers == 'DEFAULT'
 
+    def test_cert_key_chain_difference_compares_whole_items(self):
+        want = ModuleParameters(dict(
+            cert_key_chain=[
+                dict(cert='cert1', key='key2', chain='none')
+            ]
+        ))
+        have = ApiParameters(dict(
+            certKeyChain=[
+                dict(
+                    name='cert1',
+                    cert='/Common/cert1.crt',
+                    key='/Common/key1.key',
+                    chain='none'
+                ),
+                dict(
+                    name='cert2',
+                    cert='/Common/cert2.crt',
+                    key='/Common/key2.key',
+                    chain='none'
+                )
+            ]
+        ))
+        diff = Difference(want, have)
+        assert diff.compare('cert_key_chain') == want.cert_key_chain
+
 
 @patch('ansible.module_utils.f5_utils.AnsibleF5Client._get_mgmt_root',
        return_value=True)
@@ -126,3 +153,56 @@ class TestManager(unittest.TestCase):
         results = mm.exec_module()
 
         assert results['changed'] is True
+
+    def test_update_reuses_loaded_resource(self, *args):
+        set_module_args(dict(
+            name='foo',
+            ciphers='!SSLv3:!SSLv2:ECDHE+AES-GCM+SHA256',
+            password='passsword',
+            server='localhost',
+            user='admin'
+        ))
+
+        # The resource that exists() would have loaded from the device
+        resource = Mock()
+        resource.attrs = load_fixture('load_ltm_profile_clientssl.json')
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        mm = ModuleManager(client)
+        mm._resource = resource
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert results['ciphers'] == '!SSLv3:!SSLv2:ECDHE+AES-GCM+SHA256'
+        resource.modify.assert_called_once_with(
+            ciphers='!SSLv3:!SSLv2:ECDHE+AES-GCM+SHA256'
+        )
+
+    def test_remove(self, *args):
+        set_module_args(dict(
+            name='foo',
+            state='absent',
+            password='passsword',
+            server='localhost',
+            user='admin'
+        ))
+
+        resource = Mock()
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        mm = ModuleManager(client)
+        mm._resource = resource
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        resource.delete.assert_called_once_with()
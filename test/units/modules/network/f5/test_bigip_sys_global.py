@@ -129,3 +129,52 @@ class TestManager(unittest.TestCase):
 
         results = mm.exec_module()
         assert results['changed'] is True
+
+    def test_update_loads_settings_once(self, *args):
+        set_module_args(dict(
+            banner_text='this is a banner',
+            lcd_display='yes',
+            password='admin',
+            server='localhost',
+            user='admin',
+            state='present'
+        ))
+
+        resource = Mock()
+        resource.attrs = load_fixture('load_sys_global_settings.json')
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        mm = ModuleManager(client)
+        mm._resource = resource
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        resource.modify.assert_called_once_with(
+            guiSecurityBannerText='this is a banner'
+        )
+
+    def test_update_without_settings_skips_device(self, *args):
+        set_module_args(dict(
+            password='admin',
+            server='localhost',
+            user='admin',
+            state='present'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        mm = ModuleManager(client)
+        mm.read_current_from_device = Mock()
+
+        results = mm.exec_module()
+
+        assert results['changed'] is False
+        assert mm.read_current_from_device.called is False